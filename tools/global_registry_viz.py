@@ -7,6 +7,7 @@ from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, DataTable, Input
 from textual.containers import Container
 from textual.binding import Binding
+from viz_utils import intern_value
 
 # ==================================================================================================
 # WIDGET: Registry Browser
@@ -17,6 +18,10 @@ class RegistryBrowser(Container):
         super().__init__(**kwargs)
         self.json_path = json_path
         self.raw_data = [] # Stores the full dataset for filtering
+        self.haystacks = [] # Lowercased search text per row, aligned with raw_data
+        self._visible_idx = [] # Indices into raw_data currently shown, in order
+        self._filter_timer = None # Pending debounced filter, if any
+        self._last_query = "" # Query the table currently reflects
 
     def compose(self) -> ComposeResult:
         # 1. Search Bar
@@ -49,8 +54,9 @@ class RegistryBrowser(Container):
         # 2. Parse JSON
         # We keep specific exceptions for IO/JSON as they are expected runtime conditions
         try:
-            with open(self.json_path, 'r') as f:
-                data = json.load(f)
+            # Read as bytes in one call and let json decode the UTF-8 itself
+            with open(self.json_path, 'rb', buffering=0) as f:
+                data = json.loads(f.read())
         except json.JSONDecodeError as e:
             self.notify(f"Invalid JSON format: {e}", severity="error")
             raise # Re-raise to ensure visibility in logs/traceback if needed
@@ -68,7 +74,10 @@ class RegistryBrowser(Container):
         # Removed try/except around sort to expose key errors or type errors
         registry.sort(key=lambda x: (x.get('class', ''), x.get('method', '')))
 
-        # 5. Populate Table
+        # 5. Build Rows
+        # Rows are collected in a single pass and handed to the table in one batch,
+        # instead of paying the per-row refresh cost of add_row for every entry.
+        rows = []
         for item in registry:
             # Removed per-row try/except to expose malformed data
             
@@ -79,31 +88,82 @@ class RegistryBrowser(Container):
             item_type = item.get('type', 'unknown')
             return_type = item.get('return', 'void')
             params = item.get('params', [])
-            
-            if not isinstance(params, list):
+
+            # The compiler writes params pre-joined ("int, char"); join lists the same way
+            # rather than showing their repr.
+            if isinstance(params, list):
+                params = ", ".join(map(str, params))
+            else:
                 params = str(params) # Fallback if params is not a list
 
             # Format the 'Type' column with icons
             kind = "ƒ static" if item_type == 'function' else "ⓜ method"
             if item_type == 'constructor': kind = "🔨 new"
 
-            row = (class_name, method_name, kind, return_type, str(params))
-            self.raw_data.append(row)
-            table.add_row(*row)
+            # Class names, return types and parameter lists repeat across many rows; interning
+            # them keeps one shared string per distinct value instead of one per row.
+            rows.append((intern_value(class_name), method_name, kind,
+                         intern_value(return_type), intern_value(params)))
+
+        # 6. Populate Table
+        self.raw_data = rows
+        self._last_query = ""
+        self._visible_idx = list(range(len(rows)))
+        # Cells are joined with a newline (which the search Input cannot contain) so a
+        # query never matches across two adjacent cells.
+        self.haystacks = ["\n".join(map(str, row)).lower() for row in rows]
+        table.add_rows(rows)
 
     def on_input_changed(self, event: Input.Changed):
-        """Filters the table based on the search input."""
+        """Schedules a table filter based on the search input."""
         # Removed broad try/except to allow errors to surface
         if event.input.id == "reg_search":
+            # Debounce: restart the timer on every keystroke so only the final
+            # query of a typing burst actually re-filters the table.
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
             query = event.value.lower()
-            table = self.query_one("#reg_table", DataTable)
-            table.clear()
-            
-            # Re-populate table with matching rows
-            for row in self.raw_data:
-                # Safe search across all columns
-                if any(query in str(cell).lower() for cell in row):
-                    table.add_row(*row)
+            self._filter_timer = self.set_timer(0.1, lambda: self._apply_filter(query))
+
+    def _apply_filter(self, query):
+        """Filters the table to the rows matching the query."""
+        self._filter_timer = None
+        last_query = self._last_query
+        if query == last_query:
+            return # Table already shows this result
+        self._last_query = query
+
+        haystacks = self.haystacks
+        shown = self._visible_idx
+
+        # Use the edit direction to limit the scan (haystacks are lowered at load time):
+        # - Narrowing (appended characters): only currently shown rows can still match.
+        # - Widening (deleted characters): every shown row still matches, so only the
+        #   hidden rows need checking.
+        # - Anything else: full scan.
+        if query.startswith(last_query):
+            visible = [i for i in shown if query in haystacks[i]]
+            changed = len(visible) != len(shown)
+        elif last_query.startswith(query):
+            shown_set = set(shown)
+            added = [i for i, h in enumerate(haystacks) if i not in shown_set and query in h]
+            visible = sorted(shown + added)
+            changed = bool(added)
+        else:
+            visible = [i for i, h in enumerate(haystacks) if query in h]
+            changed = visible != shown
+
+        self._visible_idx = visible
+        if not changed:
+            return # Same rows as before, skip the table rebuild
+
+        # Re-populate table with matching rows
+        # (DataTable.remove_row re-indexes every remaining row, so a rebuild is cheaper
+        # than removing rows one by one.)
+        table = self.query_one("#reg_table", DataTable)
+        table.clear()
+        raw_data = self.raw_data
+        table.add_rows([raw_data[i] for i in visible])
 
 # ==================================================================================================
 # APP: Registry Dashboard
@@ -2,43 +2,104 @@ import sys
 import os
 import xml.etree.ElementTree as ET
 import json
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import webview
 
 
 # 1. PARSER
-def parse_node(element):
-    tag = element.tag
-    text = element.text.strip() if element.text else ""
-    label = tag
-    if text: label += f": {text}"
-    style_map = {
-        "class": {"f": "#1f6feb", "s": "#388bfd"}, "subroutineDec": {"f": "#238636", "s": "#2ea043"},
-        "doStatement": {"f": "#8957e5", "s": "#a371f7"}, "letStatement": {"f": "#8957e5", "s": "#a371f7"},
-        "ifStatement": {"f": "#d29922", "s": "#e3b341"}, "whileStatement": {"f": "#d29922", "s": "#e3b341"},
-        "returnStatement": {"f": "#da3633", "s": "#f85149"}, "identifier": {"f": "#30363d", "s": "#6e7681"},
-        "symbol": {"f": "#30363d", "s": "#8b949e"}, "integerConstant": {"f": "#1f6feb", "s": "#58a6ff"},
-        "stringConstant": {"f": "#1f6feb", "s": "#58a6ff"}, "keyword": {"f": "#da3633", "s": "#f85149"},
-        "default": {"f": "#30363d", "s": "#6e7681"}
+# Node colours by XML tag as (fill, stroke). Defined once here rather than rebuilt for every node.
+_NODE_STYLES = {
+    "class": ("#1f6feb", "#388bfd"), "subroutineDec": ("#238636", "#2ea043"),
+    "doStatement": ("#8957e5", "#a371f7"), "letStatement": ("#8957e5", "#a371f7"),
+    "ifStatement": ("#d29922", "#e3b341"), "whileStatement": ("#d29922", "#e3b341"),
+    "returnStatement": ("#da3633", "#f85149"), "identifier": ("#30363d", "#6e7681"),
+    "symbol": ("#30363d", "#8b949e"), "integerConstant": ("#1f6feb", "#58a6ff"),
+    "stringConstant": ("#1f6feb", "#58a6ff"), "keyword": ("#da3633", "#f85149"),
+}
+_DEFAULT_STYLE = ("#30363d", "#6e7681")
+
+
+# Flattens the AST into parallel arrays in pre-order, so the payload has no per-node dicts or repeated
+# keys. parents[i] is the index of node i's parent (-1 for the root) and is always smaller than i,
+# letting the page rebuild the hierarchy in one linear pass.
+# Labels and (fill, stroke) styles repeat heavily (keywords, symbols, common identifiers), so each
+# distinct value is stored once in "strings" / "styles" and nodes refer to it by index.
+# Walks iterparse events with an explicit stack instead of recursing, and frees each element once read.
+def flatten_ast(xml_path):
+    string_index, style_index = {}, {} # Value -> id, in first-seen order
+    name_ids, style_ids, parents = [], [], []
+    stack = [-1] # Indices of the currently open elements
+    for event, element in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            style = _NODE_STYLES.get(element.tag, _DEFAULT_STYLE)
+            stack.append(len(name_ids))
+            parents.append(stack[-2])
+            name_ids.append(-1) # Filled in on "end", once the element's text is complete
+            style_ids.append(style_index.setdefault(style, len(style_index)))
+            continue
+
+        tag = element.tag
+        text = element.text.strip() if element.text else ""
+        label = f"{tag}: {text}" if text else tag
+        name_ids[stack.pop()] = string_index.setdefault(label, len(string_index))
+        element.clear()
+
+    if not name_ids:
+        raise ValueError("Empty XML root")
+    return {
+        "strings": list(string_index), "name_ids": name_ids,
+        "styles": list(style_index), "style_ids": style_ids,
+        "parents": parents
     }
-    style = style_map.get(tag, style_map["default"])
-    return { "name": label, "fill": style["f"], "stroke": style["s"], "children": [parse_node(child) for child in element] }
+
+
+# Parses one XML file into its payload entry. Module-level so it can run in a worker process.
+def _parse_one(xml_path):
+    # Extract clean name: "Main_18293.xml" -> "Main.jack"
+    raw_name = os.path.basename(xml_path)
+    display_name = raw_name.split('_')[0] + ".jack" if "_" in raw_name else raw_name
+    return display_name, flatten_ast(xml_path)
+
+
+# Parsing is pure-Python work, so several files are spread across processes. Below this total input
+# size, starting the pool costs more than it saves.
+_PARALLEL_MIN_BYTES = 1 << 20
 
 
 # 2. LOCAL ASSET LOADER
+# Read once per process and cached. Not done at import, since the parse worker processes import this
+# module too and never need it.
+@functools.lru_cache(maxsize=None)
 def get_d3_script():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     d3_path = os.path.join(script_dir, "d3.v7.min.js")
-    if os.path.exists(d3_path):
-        try:
-            with open(d3_path, "r", encoding="utf-8") as f: return f"<script>\n{f.read()}\n</script>"
-        except:
-            pass
-    return '<script src="https://d3js.org/d3.v7.min.js"></script>'
+    try:
+        with open(d3_path, "r", encoding="utf-8") as f: return f"<script id=\"d3-lib\">\n{f.read()}\n</script>"
+    except (OSError, UnicodeDecodeError):
+        return '<script id="d3-lib" src="https://d3js.org/d3.v7.min.js"></script>'
+
+
+# 3. JS BRIDGE
+# Exposed to the page as window.pywebview.api. The payload is handed over on request instead of being
+# baked into the HTML template. It is serialized once here, but travels double-encoded: pywebview's
+# bridge json.dumps() the returned string again (ASCII-escaping it and doubling backslashes) and the
+# page JSON.parse()s it a second time. That grows escaped quotes and non-ASCII text, yet is still
+# smaller than returning the dict, which the bridge would re-serialize with padded ", " / ": "
+# separators around every element of the integer arrays.
+class PayloadApi:
+    def __init__(self, files_payload):
+        # Compact separators keep the payload small: no padding after every comma and colon.
+        # Raw UTF-8 still pays off: the bridge escapes each non-ASCII character once, rather than
+        # also doubling the backslash of a \uXXXX escape made here.
+        self._payload = json.dumps(files_payload, separators=(",", ":"), ensure_ascii=False)
+
+    def get_payload(self):
+        return self._payload
 
 
-# 3. HTML GENERATOR
-def get_html_content(files_payload, d3_script_tag):
-    json_str = json.dumps(files_payload)
+# 4. HTML GENERATOR
+def get_html_content(d3_script_tag):
     return f"""
 <!DOCTYPE html>
 <html>
@@ -91,77 +152,320 @@ def get_html_content(files_payload, d3_script_tag):
     <canvas id="viz"></canvas>
 
     <script>
-        const allFiles = {json_str};
+        let allFiles = [];
         let currentTransform = d3.zoomIdentity;
+        let zooming = false; // True during a zoom/pan gesture
         const canvas = document.querySelector("#viz");
-        const ctx = canvas.getContext("2d", {{ alpha: false }});
+        // Transparent canvas: the static #0d1117 backdrop is the page background underneath it,
+        // so frames only clear the canvas instead of repainting the background.
+        const ctx = canvas.getContext("2d");
+        let dpr = window.devicePixelRatio || 1;
         
-        // --- Populate Dropdown ---
-        const select = document.getElementById("file-select");
-        allFiles.forEach((file, index) => {{
-            const opt = document.createElement("option");
-            opt.value = index;
-            opt.textContent = file.filename;
-            select.appendChild(opt);
-        }});
+        const ROW_SPACING = 40, COLUMN_SPACING = 200;
+
+        // Rebuilds a d3 hierarchy from the flat pre-order parent indices in a single pass,
+        // creating d3's node objects directly instead of walking a nested tree. Returns the nodes
+        // in payload order (nodes[0] is the root); dataFor(i) supplies each node's data.
+        // Also runs inside the layout worker, so it must only depend on d3.
+        function buildHierarchy(parents, dataFor) {{
+            const HierarchyNode = d3.hierarchy.prototype.constructor;
+            const n = parents.length;
+            const nodes = new Array(n);
+            for (let i = 0; i < n; i++) {{
+                const node = new HierarchyNode(dataFor(i));
+                const p = parents[i];
+                if (p >= 0) {{
+                    const parent = nodes[p];
+                    node.parent = parent;
+                    node.depth = parent.depth + 1;
+                    (parent.children || (parent.children = [])).push(node);
+                }}
+                nodes[i] = node;
+            }}
+            // Children always follow their parent, so a reverse sweep settles every height.
+            for (let i = n - 1; i > 0; i--) {{
+                const parent = nodes[i].parent;
+                if (parent.height <= nodes[i].height) parent.height = nodes[i].height + 1;
+            }}
+            return nodes;
+        }}
+
+        // Runs the tree layout on the bare structure and returns node positions by payload index.
+        function layoutPositions(parents) {{
+            const nodes = buildHierarchy(parents, i => i);
+            d3.tree().nodeSize([ROW_SPACING, COLUMN_SPACING])(nodes[0]);
+            const xs = new Float64Array(nodes.length), ys = new Float64Array(nodes.length);
+            for (let i = 0; i < nodes.length; i++) {{ xs[i] = nodes[i].x; ys[i] = nodes[i].y; }}
+            return {{ xs, ys }};
+        }}
+
+        // --- Layout Worker ---
+        // The layout runs off the main thread so large files do not freeze the page. The worker is
+        // built from the same d3 source as the page (inline text, or the CDN URL) plus the two
+        // functions above; parent indices go in and positions come back as transferred buffers.
+        // If a worker cannot be created or fails, layout falls back to the main thread.
+        let layoutWorker;
+        let nextLayoutId = 0;
+        const pendingLayouts = new Map();
+
+        function getLayoutWorker() {{
+            if (layoutWorker !== undefined) return layoutWorker;
+            try {{
+                const d3Tag = document.getElementById("d3-lib");
+                const source = [
+                    d3Tag.src ? `importScripts(${{JSON.stringify(d3Tag.src)}});` : d3Tag.textContent,
+                    `const ROW_SPACING = ${{ROW_SPACING}}, COLUMN_SPACING = ${{COLUMN_SPACING}};`,
+                    buildHierarchy.toString(),
+                    layoutPositions.toString(),
+                    `onmessage = e => {{
+                        const r = layoutPositions(e.data.parents);
+                        postMessage({{ id: e.data.id, xs: r.xs, ys: r.ys }}, [r.xs.buffer, r.ys.buffer]);
+                    }};`
+                ].join("\\n");
+                layoutWorker = new Worker(URL.createObjectURL(new Blob([source], {{ type: "text/javascript" }})));
+                layoutWorker.onmessage = e => {{
+                    const job = pendingLayouts.get(e.data.id);
+                    pendingLayouts.delete(e.data.id);
+                    if (job) job.resolve({{ xs: e.data.xs, ys: e.data.ys }});
+                }};
+                layoutWorker.onerror = e => {{
+                    e.preventDefault();
+                    layoutWorker.terminate();
+                    layoutWorker = null;
+                    pendingLayouts.forEach(job => job.resolve(layoutPositions(job.parents)));
+                    pendingLayouts.clear();
+                }};
+            }} catch (err) {{
+                layoutWorker = null;
+            }}
+            return layoutWorker;
+        }}
+
+        function computeLayout(parents) {{
+            const worker = getLayoutWorker();
+            if (!worker) return Promise.resolve(layoutPositions(parents));
+            return new Promise(resolve => {{
+                const id = nextLayoutId++;
+                pendingLayouts.set(id, {{ resolve, parents }});
+                const buffer = Int32Array.from(parents);
+                worker.postMessage({{ id, parents: buffer }}, [buffer.buffer]);
+            }});
+        }}
+
+        const NODE_FONT = "600 12px sans-serif";
+        const BLOCK_SIZE = 64; // Nodes per prepared block (and links per cached Path2D)
+
+        // Label widths, memoized per string: AST labels repeat heavily (keywords, symbols, common
+        // identifiers) and the font never changes, so each distinct label is measured once.
+        const textWidthCache = new Map();
+        function measure(name) {{
+            let w = textWidthCache.get(name);
+            if (w === undefined) {{
+                w = ctx.measureText(name).width;
+                textWidthCache.set(name, w);
+            }}
+            return w;
+        }}
+
+        // Groups nodes into columns by depth (the layout places depth d at y = d * COLUMN_SPACING)
+        // and sorts each column by x, so draw() can binary-search the rows in view instead of
+        // scanning every node. Each non-root node also owns the link to its parent; linkHiMax and
+        // linkLoMin are running bounds of the links' vertical extents, which keeps the bisect valid
+        // even where links in a column are not perfectly ordered.
+        // The per-node render data is left to prepareBlock(), so a file can be painted before
+        // every node has been measured.
+        function indexColumns(root) {{
+            const columns = [];
+            root.each(d => {{ (columns[d.depth] || (columns[d.depth] = {{ nodes: [] }})).nodes.push(d); }});
+            columns.forEach((col, depth) => {{
+                const nodes = col.nodes.sort((a, b) => a.x - b.x);
+                const n = nodes.length;
+                col.xs = Float64Array.from(nodes, d => d.x);
+                col.ready = new Uint8Array(Math.ceil(n / BLOCK_SIZE));
+                col.readyCount = 0;
+                col.linkBlocks = [];
+                col.preparedMaxW = 0;
+                col.maxW = Infinity; // Unknown until every block is prepared; disables left-edge culling
+                if (depth === 0) return;
+                col.linkHiMax = new Float64Array(n);
+                col.linkLoMin = new Float64Array(n);
+                let hiMax = -Infinity, loMin = Infinity;
+                for (let i = 0; i < n; i++) {{
+                    hiMax = Math.max(hiMax, nodes[i].x, nodes[i].parent.x);
+                    col.linkHiMax[i] = hiMax;
+                }}
+                for (let i = n - 1; i >= 0; i--) {{
+                    loMin = Math.min(loMin, nodes[i].x, nodes[i].parent.x);
+                    col.linkLoMin[i] = loMin;
+                }}
+            }});
+            return columns;
+        }}
+
+        // Computes the render data for BLOCK_SIZE consecutive nodes of a column: box widths
+        // (d.data._w) and, since link curves never change after layout, one Path2D holding the
+        // links to their parents. The column's widest box becomes known once all blocks are done.
+        function prepareBlock(col, depth, b) {{
+            const nodes = col.nodes;
+            const start = b * BLOCK_SIZE, end = Math.min(start + BLOCK_SIZE, nodes.length);
+            ctx.font = NODE_FONT;
+            for (let i = start; i < end; i++) {{
+                const w = Math.max(120, measure(nodes[i].data.name) + 30);
+                nodes[i].data._w = w;
+                if (w > col.preparedMaxW) col.preparedMaxW = w;
+            }}
+            if (depth > 0) {{
+                const path = new Path2D();
+                const linkGen = d3.linkHorizontal().x(d => d.y).y(d => d.x).context(path);
+                for (let i = start; i < end; i++) linkGen({{ source: nodes[i].parent, target: nodes[i] }});
+                col.linkBlocks[b] = path;
+            }}
+            col.ready[b] = 1;
+            if (++col.readyCount === col.ready.length) col.maxW = col.preparedMaxW;
+        }}
+
+        // Ensures the blocks covering nodes [lo, hi) of a column are prepared.
+        function prepareRange(col, depth, lo, hi) {{
+            const lastBlock = Math.floor((hi - 1) / BLOCK_SIZE);
+            for (let b = Math.floor(lo / BLOCK_SIZE); b <= lastBlock; b++) {{
+                if (!col.ready[b]) prepareBlock(col, depth, b);
+            }}
+        }}
+
+        // Prepares the remaining (off-screen) blocks in idle time after the first paint, so large
+        // files open without a long freeze. Pauses while a zoom/pan gesture is in progress and stops
+        // if another file is loaded.
+        const scheduleIdle = window.requestIdleCallback || (cb => setTimeout(() => cb({{ timeRemaining: () => 8 }}), 16));
+        function prepareInIdle(columns) {{
+            let depth = 0, b = 0;
+            function step(deadline) {{
+                if (window.currentColumns !== columns) return;
+                if (!zooming) {{
+                    while (depth < columns.length && deadline.timeRemaining() > 2) {{
+                        const col = columns[depth];
+                        if (b < col.ready.length) {{
+                            if (!col.ready[b]) prepareBlock(col, depth, b);
+                            b++;
+                        }} else {{
+                            depth++; b = 0;
+                        }}
+                    }}
+                    if (depth >= columns.length) return;
+                }}
+                scheduleIdle(step);
+            }}
+            scheduleIdle(step);
+        }}
+
+        let loadToken = 0; // Identifies the latest loadFile call, so stale layouts are dropped
 
         function loadFile(index) {{
-            const root = d3.hierarchy(allFiles[index].tree);
-            const treeLayout = d3.tree().nodeSize([40, 200]);
-            treeLayout(root);
-            window.currentRoot = root;
-            
-            // Reset zoom to nicely fit the new tree
-            const initialY = window.innerHeight / 2;
-            d3.select(canvas).call(zoom.transform, d3.zoomIdentity.translate(100, initialY).scale(0.8));
-            
-            requestAnimationFrame(draw);
+            const token = ++loadToken;
+            const ast = allFiles[index].ast;
+            computeLayout(ast.parents).then(({{ xs, ys }}) => {{
+                if (token !== loadToken) return;
+                const strings = ast.strings, nameIds = ast.name_ids, styles = ast.styles, styleIds = ast.style_ids;
+                const nodes = buildHierarchy(ast.parents, i => {{
+                    const style = styles[styleIds[i]];
+                    return {{ name: strings[nameIds[i]], fill: style[0], stroke: style[1] }};
+                }});
+                for (let i = 0; i < nodes.length; i++) {{ nodes[i].x = xs[i]; nodes[i].y = ys[i]; }}
+                const root = nodes[0];
+                const columns = indexColumns(root);
+                window.currentColumns = columns;
+                window.currentRoot = root;
+                
+                // Reset zoom to nicely fit the new tree
+                const initialY = window.innerHeight / 2;
+                d3.select(canvas).call(zoom.transform, d3.zoomIdentity.translate(100, initialY).scale(0.8));
+                
+                // The first frame prepares only what is in view; the rest follows in idle time.
+                requestAnimationFrame(draw);
+                prepareInIdle(columns);
+            }});
         }}
 
         function draw() {{
             if (!window.currentRoot) return;
-            const root = window.currentRoot;
-            const width = canvas.width / window.devicePixelRatio;
-            const height = canvas.height / window.devicePixelRatio;
+            const columns = window.currentColumns;
+            const width = canvas.width / dpr;
+            const height = canvas.height / dpr;
             const k = currentTransform.k, tx = currentTransform.x, ty = currentTransform.y;
 
-            ctx.save();
-            ctx.scale(window.devicePixelRatio, window.devicePixelRatio);
-            ctx.fillStyle = "#0d1117"; ctx.fillRect(0, 0, width, height);
-            ctx.translate(tx, ty); ctx.scale(k, k);
-
-            ctx.beginPath(); ctx.strokeStyle = "#30363d"; ctx.lineWidth = 2;
-            const linkGen = d3.linkHorizontal().x(d => d.y).y(d => d.x).context(ctx);
-            root.links().forEach(d => linkGen(d));
-            ctx.stroke();
-
-            ctx.font = "600 12px sans-serif"; ctx.textBaseline = "middle"; ctx.lineWidth = 1.5;
-            root.descendants().forEach(d => {{
-                if (d.x * k + ty < -50 || d.x * k + ty > height + 50) return;
-                const w = Math.max(120, ctx.measureText(d.data.name).width + 30);
-                const h = 26, x = d.y, y = d.x - 13;
-                
-                ctx.beginPath(); ctx.roundRect(x, y, w, h, 6); 
-                ctx.fillStyle = d.data.fill; ctx.fill();
-                ctx.strokeStyle = d.data.stroke; ctx.stroke();
-                if (k > 0.4) {{ ctx.fillStyle = "#fff"; ctx.fillText(d.data.name, x + 10, d.x + 1); }}
-            }});
-            ctx.restore();
+            // Visible band in layout coordinates: rows (x) with a 50px margin, and the last
+            // column whose left edge is still on screen.
+            const xMin = (-50 - ty) / k, xMax = (height + 50 - ty) / k;
+            const yMin = -tx / k;
+            const lastColumn = Math.min(columns.length - 1, Math.floor((width - tx) / k / COLUMN_SPACING));
+
+            ctx.setTransform(1, 0, 0, 1, 0, 0);
+            ctx.clearRect(0, 0, canvas.width, canvas.height);
+            // Device pixel ratio and zoom folded into a single matrix.
+            ctx.setTransform(dpr * k, 0, 0, dpr * k, dpr * tx, dpr * ty);
+
+            ctx.strokeStyle = "#30363d"; ctx.lineWidth = 2;
+            // A link runs from its parent's column to its own, so links into the first
+            // off-screen column still start on screen.
+            for (let depth = 1; depth <= Math.min(lastColumn + 1, columns.length - 1); depth++) {{
+                if (depth * COLUMN_SPACING < yMin) continue; // Link ends left of the viewport
+                const col = columns[depth];
+                const lo = d3.bisectLeft(col.linkHiMax, xMin), hi = d3.bisectRight(col.linkLoMin, xMax);
+                if (lo >= hi) continue;
+                prepareRange(col, depth, lo, hi);
+                const lastBlock = Math.floor((hi - 1) / BLOCK_SIZE);
+                for (let b = Math.floor(lo / BLOCK_SIZE); b <= lastBlock; b++) ctx.stroke(col.linkBlocks[b]);
+            }}
+
+            ctx.font = NODE_FONT; ctx.textBaseline = "middle"; ctx.lineWidth = 1.5;
+            for (let depth = 0; depth <= lastColumn; depth++) {{
+                const col = columns[depth];
+                if (depth * COLUMN_SPACING + col.maxW < yMin) continue; // Widest box ends left of the viewport
+                const lo = d3.bisectLeft(col.xs, xMin), hi = d3.bisectRight(col.xs, xMax);
+                if (lo >= hi) continue;
+                prepareRange(col, depth, lo, hi);
+                for (let i = lo; i < hi; i++) {{
+                    const d = col.nodes[i];
+                    const w = d.data._w;
+                    const h = 26, x = d.y, y = d.x - 13;
+                    
+                    ctx.beginPath(); ctx.roundRect(x, y, w, h, 6); 
+                    ctx.fillStyle = d.data.fill; ctx.fill();
+                    ctx.strokeStyle = d.data.stroke; ctx.stroke();
+                    if (k > 0.4) {{ ctx.fillStyle = "#fff"; ctx.fillText(d.data.name, x + 10, d.x + 1); }}
+                }}
+            }}
         }}
 
         const zoom = d3.zoom().scaleExtent([0.1, 4]).on("zoom", e => {{
             currentTransform = e.transform; requestAnimationFrame(draw);
-        }});
+        }}).on("start", () => {{ zooming = true; }}).on("end", () => {{ zooming = false; }});
         d3.select(canvas).call(zoom).on("dblclick.zoom", null);
 
         window.addEventListener("resize", () => {{
-            const dpr = window.devicePixelRatio || 1;
+            dpr = window.devicePixelRatio || 1;
             canvas.width = window.innerWidth * dpr; canvas.height = window.innerHeight * dpr;
             requestAnimationFrame(draw);
         }});
         window.dispatchEvent(new Event('resize'));
 
-        if (allFiles.length > 0) loadFile(0);
+        // --- Load Payload ---
+        // The ASTs are fetched from Python over the pywebview bridge once it is available.
+        async function init() {{
+            allFiles = JSON.parse(await window.pywebview.api.get_payload());
+
+            // --- Populate Dropdown ---
+            const select = document.getElementById("file-select");
+            allFiles.forEach((file, index) => {{
+                const opt = document.createElement("option");
+                opt.value = index;
+                opt.textContent = file.filename;
+                select.appendChild(opt);
+            }});
+
+            if (allFiles.length > 0) loadFile(0);
+        }}
+        if (window.pywebview && window.pywebview.api) init();
+        else window.addEventListener("pywebviewready", init, {{ once: true }});
     </script>
 </body>
 </html>
@@ -179,26 +483,29 @@ if __name__ == "__main__":
     errors = []
 
     # Parse Files with Explicit Error Handling
+    valid_files = []
+    total_bytes = 0
     for xml_path in xml_files:
-        if not os.path.exists(xml_path):
+        try:
+            total_bytes += os.path.getsize(xml_path)
+        except OSError:
             print(f" Error: File not found: {xml_path}", file=sys.stderr)
             errors.append(xml_path)
             continue
+        valid_files.append(xml_path)
 
-        try:
-            tree = ET.parse(xml_path)
-
-            # Extract clean name: "Main_18293.xml" -> "Main.jack"
-            raw_name = os.path.basename(xml_path)
-            display_name = raw_name.split('_')[0] + ".jack" if "_" in raw_name else raw_name
+    futures = None
+    if len(valid_files) > 1 and total_bytes >= _PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=min(len(valid_files), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(_parse_one, xml_path) for xml_path in valid_files]
 
-            root = tree.getroot()
-            if root is None:
-                raise ValueError("Empty XML root")
+    for i, xml_path in enumerate(valid_files):
+        try:
+            display_name, ast = futures[i].result() if futures else _parse_one(xml_path)
 
             files_payload.append({
                 "filename": display_name,
-                "tree": parse_node(root)
+                "ast": ast
             })
 
         except ET.ParseError as e:
@@ -217,10 +524,11 @@ if __name__ == "__main__":
 
     # Launch GUI
     try:
-        html_content = get_html_content(files_payload, get_d3_script())
+        html_content = get_html_content(get_d3_script())
         webview.create_window(
             title="Jack Visualizer",
             html=html_content,
+            js_api=PayloadApi(files_payload),
             width=1280,
             height=800,
             background_color='#0d1117'
@@ -1,12 +1,83 @@
-import json
 import os
 import sys
 import atexit
 import traceback
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+import ijson
+try:
+    # orjson is noticeably faster for the on-demand full parse; fall back to the stdlib if missing
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+from rich.text import Text
+from textual import work
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, DataTable, Tree, Label
 from textual.containers import Container, Vertical, Horizontal
 from textual.binding import Binding
+from textual.worker import get_current_worker
+from viz_utils import intern_value
+
+# ==================================================================================================
+# HEADER SCAN
+# Streams a symbol file and keeps only what the navigation tree needs.
+# ==================================================================================================
+def scan_header(path):
+    """
+    Returns (className, subroutine names) for a symbol file without building its full tree.
+    className is None if absent; the name list is None if 'subroutines' is not a list.
+    """
+    class_name = None
+    sub_names = []
+    subs_done = False
+    # ijson pulls the file in small chunks; a 1 MB buffer turns those into far fewer read calls
+    with open(path, 'rb', buffering=1 << 20) as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "className":
+                class_name = value
+            elif prefix == "subroutines":
+                if event == "start_array": continue
+                if event != "end_array": sub_names = None # Not a list
+                subs_done = True
+            elif prefix == "subroutines.item" and event == "start_map":
+                sub_names.append("unknown") # Replaced below if the entry has a name
+            elif prefix == "subroutines.item.name":
+                sub_names[-1] = value
+
+            # The compiler writes className before subroutines, so the rest can be skipped
+            if subs_done and class_name is not None:
+                break
+    return class_name, sub_names
+
+def load_json(path):
+    """Parses a JSON file, with orjson when it is installed."""
+    # Both parsers accept the raw UTF-8 bytes, so there is no text decoding layer.
+    # read() with no size fetches the whole file at once, so no read buffer is needed.
+    with open(path, 'rb', buffering=0) as f:
+        return json_loads(f.read())
+
+# Icon shown in the Kind column; anything else gets "⚪"
+_KIND_ICON = {"local": "📦", "argument": "📥", "static": "💾", "field": "🏷️"}
+# Kind cells are prebuilt as Text so DataTable renders them directly instead of parsing
+# a markup string per row. The instances are shared read-only between rows.
+_KIND_CELL = {kind: Text(f"{icon} {kind}", end="") for kind, icon in _KIND_ICON.items()}
+
+# Compact, attribute-access form of a symbol, built once per class load.
+# Missing fields carry the table's placeholders. index is the sort value (0 if missing, so
+# every Symbol can be ordered by (kind, index)); index_label is the text shown ("?" if missing).
+Symbol = namedtuple("Symbol", "name type kind index index_label")
+
+def _to_symbol(record):
+    """Converts a parsed symbol dict to a Symbol, interning its repeated kind and type strings."""
+    index = record.get('index')
+    return Symbol(record.get('name', '?'), intern_value(record.get('type', '?')),
+                  intern_value(record.get('kind', 'unknown')),
+                  0 if index is None else index, "?" if index is None else str(index))
+
+# Orders symbols by kind, then index (a C-level key, no Python call per comparison)
+_SYM_SORT_KEY = attrgetter("kind", "index")
 
 # ==================================================================================================
 # WIDGET: Symbol Table Browser
@@ -22,7 +93,12 @@ class SymbolTableBrowser(Container):
     def __init__(self, symbol_paths, **kwargs):
         super().__init__(**kwargs)
         self.symbol_paths = symbol_paths
-        self.data_cache = {} # Cache loaded JSON data by class name
+        self.symbol_files = {} # Symbol file path by class name
+        # Scope map of the class currently on screen; the previous one is dropped on switch
+        self._cur_class = None
+        self._cur_scopes = None
+        self._current_scope = None # (class, scope) currently shown in the table
+        self._tree = self._table = self._label = None # Set in on_mount
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="split-view"):
@@ -39,57 +115,106 @@ class SymbolTableBrowser(Container):
     def on_mount(self):
         """Initialize the widget after mounting."""
         # Removed broad try/except to allow errors to surface
+        # Widget references are looked up once here instead of on every selection
+        self._tree = self.query_one("#file_tree", Tree)
+        self._table = self.query_one("#sym_table", DataTable)
+        self._label = self.query_one("#sym_title", Label)
+
+        self._tree.root.expand()
+        self._table.add_columns("Name", "Type", "Kind", "Index")
         self.load_files()
 
+    @work(thread=True, group="ingest")
     def load_files(self):
-        """Loads JSON files and populates the navigation tree."""
+        """Scans the JSON files off the UI thread, adding each class to the tree as it is read."""
         # Removed broad try/except to allow errors to surface
-        tree = self.query_one("#file_tree", Tree)
-        tree.root.expand()
-
-        table = self.query_one("#sym_table", DataTable)
-        table.add_columns("Name", "Type", "Kind", "Index")
-
+        # Headers are scanned on a small thread pool; results are consumed in input order,
+        # so the tree keeps the order the files were given in.
+        call = self.app.call_from_thread
+        paths = []
         for path in self.symbol_paths:
             if not os.path.exists(path):
-                self.notify(f"File not found: {path}", severity="warning")
+                call(self.notify, f"File not found: {path}", severity="warning")
                 continue
-            
-            try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-
-                # Use class name as key, fallback to filename
-                name = data.get("className", os.path.basename(path))
-                self.data_cache[name] = data
-
-                # Add File Node (Class)
-                file_node = tree.root.add(f"📄 {name}", expand=True)
-                file_node.data = {"type": "file", "class": name}
-
-                # Add Scopes
-                # 1. Class Scope (Static/Field)
-                c_node = file_node.add("🔒 Class Scope")
-                c_node.data = {"type": "scope", "class": name, "scope": "class"}
-
-                # 2. Subroutines (Local/Argument)
-                subroutines = data.get("subroutines", [])
-                if isinstance(subroutines, list):
-                    for sub in subroutines:
-                        sub_name = sub.get('name', 'unknown')
-                        s_node = file_node.add(f"ƒ {sub_name}")
-                        s_node.data = {"type": "scope", "class": name, "scope": sub_name}
-                else:
-                    self.notify(f"Invalid 'subroutines' format in {name}", severity="warning")
-                    # We don't raise here to allow partial loading of other files, 
-                    # but we notify. If strictness is required, we could raise.
-
-            except json.JSONDecodeError as e:
-                self.notify(f"Invalid JSON in {path}: {e}", severity="error")
-                raise # Re-raise to ensure visibility
-            except Exception as e:
-                self.notify(f"Error loading {path}: {e}", severity="error")
-                raise # Re-raise to ensure visibility
+            paths.append(path)
+
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            # Only the header is read here; full symbol data is loaded on selection
+            headers = pool.map(scan_header, paths)
+            for path in paths:
+                try:
+                    class_name, sub_names = next(headers)
+                except ijson.JSONError as e:
+                    call(self.notify, f"Invalid JSON in {path}: {e}", severity="error")
+                    raise # Re-raise to ensure visibility
+                except Exception as e:
+                    call(self.notify, f"Error loading {path}: {e}", severity="error")
+                    raise # Re-raise to ensure visibility
+
+                call(self._add_file_node, path, class_name, sub_names)
+
+    def _add_file_node(self, path, class_name, sub_names):
+        """Adds a scanned class and its scopes to the navigation tree."""
+        tree = self._tree
+
+        # Use class name as key, fallback to filename
+        name = class_name if class_name is not None else os.path.basename(path)
+        self.symbol_files[name] = path
+
+        # All of the class's nodes are added under one batch, so the tree repaints once per
+        # class rather than once per node.
+        with self.app.batch_update():
+            # Add File Node (Class)
+            file_node = tree.root.add(f"📄 {name}", expand=True)
+            file_node.data = {"type": "file", "class": name}
+
+            # Add Scopes
+            # 1. Class Scope (Static/Field)
+            c_node = file_node.add("🔒 Class Scope")
+            c_node.data = {"type": "scope", "class": name, "scope": "class"}
+
+            # 2. Subroutines (Local/Argument)
+            for sub_name in sub_names or ():
+                s_node = file_node.add(f"ƒ {sub_name}")
+                s_node.data = {"type": "scope", "class": name, "scope": sub_name}
+
+        if sub_names is None:
+            self.notify(f"Invalid 'subroutines' format in {name}", severity="warning")
+            # We don't raise here to allow partial loading of other files, 
+            # but we notify. If strictness is required, we could raise.
+
+    def _load_full(self, class_name):
+        """
+        Returns (scopes, invalid): the class's scopes as {scope name: symbols sorted by kind
+        and index}, with the class scope keyed "class", and the names of scopes whose symbols
+        were not a list. Those are normalized to empty lists here, once, so the display path
+        needs no type checks.
+        """
+        path = self.symbol_files.get(class_name)
+        if path is None:
+            return {}, []
+        data = load_json(path)
+
+        # Sort each scope once here rather than on every selection.
+        invalid = []
+        def sort_symbols(scope_name, symbols):
+            if not isinstance(symbols, list):
+                invalid.append(scope_name)
+                return []
+            scope = [_to_symbol(sym) for sym in symbols]
+            scope.sort(key=_SYM_SORT_KEY)
+            return scope
+
+        scopes = {"class": sort_symbols("class", data.get("classSymbols", []))}
+        subroutines = data.get("subroutines", [])
+        if not isinstance(subroutines, list):
+            subroutines = [] # Already reported when the tree was built
+        for sub in subroutines:
+            sub_name = sub.get('name')
+            if sub_name not in scopes: # First definition wins, as in a linear search
+                scopes[sub_name] = sort_symbols(sub_name, sub.get('symbols', []))
+
+        return scopes, invalid
 
     def on_tree_node_selected(self, event: Tree.NodeSelected):
         """Handles tree node selection to update the symbol table."""
@@ -103,47 +228,57 @@ class SymbolTableBrowser(Container):
     def show_symbol_table(self, class_name, scope_name):
         """Populates the data table with symbols for the selected scope."""
         # Removed broad try/except to allow errors to surface
-        table = self.query_one("#sym_table", DataTable)
-        label = self.query_one("#sym_title", Label)
+        key = (class_name, scope_name)
+        if key == self._current_scope:
+            return # Re-selected the scope already on screen
+        self._current_scope = key
 
-        table.clear()
-        data = self.data_cache.get(class_name, {})
+        table = self._table
+        label = self._label
 
-        symbols = []
+        table.clear()
         if scope_name == "class":
             label.update(f"Scope: {class_name} (Static/Fields)")
-            symbols = data.get("classSymbols", [])
         else:
             label.update(f"Scope: {class_name}.{scope_name}")
-            subroutines = data.get("subroutines", [])
-            if isinstance(subroutines, list):
-                for sub in subroutines:
-                    if sub.get('name') == scope_name:
-                        symbols = sub.get('symbols', [])
-                        break
 
-        if not isinstance(symbols, list):
-            self.notify(f"Invalid symbols format for {scope_name}", severity="error")
-            raise ValueError(f"Invalid symbols format for {scope_name}")
+        if class_name == self._cur_class:
+            self._fill_table(scope_name)
+        else:
+            self._load_class(class_name, scope_name) # Parsed in the background
+
+    @work(thread=True, exclusive=True, group="symbols")
+    def _load_class(self, class_name, scope_name):
+        """Parses a class off the UI thread, then shows the requested scope."""
+        scopes, invalid = self._load_full(class_name)
+        if invalid:
+            names = ", ".join(map(str, invalid))
+            self.app.call_from_thread(self.notify, f"Invalid symbols format in {class_name}: {names}", severity="warning")
+        if get_current_worker().is_cancelled:
+            return # A newer selection replaced this one
+        self.app.call_from_thread(self._class_loaded, class_name, scopes, scope_name)
+
+    def _class_loaded(self, class_name, scopes, scope_name):
+        """Makes a freshly parsed class current and shows the requested scope."""
+        if self._current_scope != (class_name, scope_name):
+            return # The selection moved on while this class was parsing
+        self._cur_class, self._cur_scopes = class_name, scopes
+        self._fill_table(scope_name)
 
-        # Sort: Kind -> Index
-        # Removed try/except around sort
-        symbols.sort(key=lambda x: (x.get('kind', ''), x.get('index', 0)))
+    def _fill_table(self, scope_name):
+        """Fills the data table with a scope of the current class."""
+        table = self._table
+        # Already sorted: Kind -> Index
+        symbols = self._cur_scopes.get(scope_name, [])
 
+        # Rows are built up front and added in one batch instead of one add_row per symbol
+        rows = []
         for s in symbols:
             # Removed per-row try/except
-            kind = s.get('kind', 'unknown')
-            name = s.get('name', '?')
-            type_ = s.get('type', '?')
-            index = s.get('index', '?')
-
-            kind_icon = "⚪"
-            if kind == "local": kind_icon = "📦"
-            elif kind == "argument": kind_icon = "📥"
-            elif kind == "static": kind_icon = "💾"
-            elif kind == "field": kind_icon = "🏷️"
-
-            table.add_row(name, type_, f"{kind_icon} {kind}", str(index))
+            kind_cell = _KIND_CELL.get(s.kind)
+            if kind_cell is None: kind_cell = Text(f"⚪ {s.kind}", end="")
+            rows.append((s.name, s.type, kind_cell, s.index_label))
+        table.add_rows(rows)
 
 # ==================================================================================================
 # APP: Symbol Table App
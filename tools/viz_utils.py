@@ -0,0 +1,9 @@
+import sys
+
+# ==================================================================================================
+# SHARED HELPERS
+# Small utilities used by more than one of the Textual visualizers.
+# ==================================================================================================
+def intern_value(value):
+    """Interns string values; anything else is passed through unchanged."""
+    return sys.intern(value) if type(value) is str else value